@@ -1,4 +1,7 @@
+import io
+import itertools
 import json
+import logging
 import urllib.request
 import urllib.error
 import azure.functions as func
@@ -12,10 +15,34 @@ load_dotenv()
 env_model_url = os.getenv('MODEL_ENDPOINT_URL')
 env_model_key = os.getenv('MODEL_KEY')
 
+def get_int_setting(name, default):
+    # A malformed setting must not fail the import and take every function down with it
+    value = os.getenv(name)
+    if value is None or value.strip() == '':
+        return default
+    try:
+        parsed = int(value)
+    except ValueError:
+        parsed = -1
+    if parsed < 0:
+        logging.warning(f"Invalid value for {name}: {value!r}. Using the default of {default}.")
+        return default
+    return parsed
+
+# Bodies are buffered, so these size limits are what keeps memory per request bounded
+env_max_request_bytes = get_int_setting('MAX_REQUEST_BODY_BYTES', 1024 * 1024)
+env_max_response_bytes = get_int_setting('MAX_RESPONSE_BODY_BYTES', 1024 * 1024)
+env_max_batch_size = get_int_setting('MAX_BATCH_SIZE', 100)
+env_max_batch_response_bytes = get_int_setting('MAX_BATCH_RESPONSE_BYTES', 1024 * 1024)
+
+RESPONSE_CHUNK_SIZE = 64 * 1024
+NDJSON_MIMETYPES = ('application/x-ndjson', 'application/ndjson', 'application/jsonlines')
+
 class PostClassifier:
-    def __init__(self, model_url, model_key):
+    def __init__(self, model_url, model_key, max_response_bytes=None):
         self.model_url = model_url
         self.model_key = model_key
+        self.max_response_bytes = env_max_response_bytes if max_response_bytes is None else max_response_bytes
 
     def classify_post(self, post_text):
         if not isinstance(post_text, str):
@@ -32,7 +59,7 @@ class PostClassifier:
         try:
             with urllib.request.urlopen(req) as response:
                 return {
-                    "body": response.read().decode('utf-8'),
+                    "body": self._read_limited(response).decode('utf-8'),
                     "status_code": response.getcode()
                 }
         except urllib.error.HTTPError as e:
@@ -40,6 +67,41 @@ class PostClassifier:
         except urllib.error.URLError as e:
             raise Exception(f"URL error occurred: {e.reason}")
 
+    def _read_limited(self, response):
+        # Read the upstream body in chunks so an oversized response is rejected before it is buffered
+        content_length = response.headers.get('Content-Length')
+        if content_length:
+            if not content_length.isdigit():
+                raise Exception(f"Model response has an invalid Content-Length: {content_length}")
+            if int(content_length) > self.max_response_bytes:
+                raise Exception(f"Model response exceeds {self.max_response_bytes} bytes")
+
+        chunks = []
+        size = 0
+        while True:
+            chunk = response.read(RESPONSE_CHUNK_SIZE)
+            if not chunk:
+                break
+            size += len(chunk)
+            if size > self.max_response_bytes:
+                raise Exception(f"Model response exceeds {self.max_response_bytes} bytes")
+            chunks.append(chunk)
+        return b''.join(chunks)
+
+def iter_ndjson_lines(body):
+    """Yield (line_number, line) pairs for the non-empty lines of an already buffered NDJSON body."""
+    for line_number, line in enumerate(io.BytesIO(body), start=1):
+        line = line.strip()
+        if line:
+            yield line_number, line
+
+def parse_model_body(body):
+    # A malformed model response is an upstream fault, not invalid client input
+    try:
+        return json.loads(body)
+    except ValueError as e:
+        raise Exception(f"Invalid model response: {str(e)}")
+
 def classify_post_function_wrapper(req_body):
     if not env_model_url or not env_model_key:
         return func.HttpResponse(
@@ -77,11 +139,87 @@ def classify_post_function_wrapper(req_body):
             mimetype="application/json"
         )
 
+def classify_batch_function_wrapper(body):
+    if not env_model_url or not env_model_key:
+        return func.HttpResponse(
+            body="An error occurred: Missing required environment variables ",
+            status_code=500,
+            mimetype="application/json"
+        )
+
+    # Stop splitting as soon as the batch is known to be too large
+    lines = list(itertools.islice(iter_ndjson_lines(body), env_max_batch_size + 1))
+    if len(lines) > env_max_batch_size:
+        return func.HttpResponse(
+            body=f"Batch too large: more than {env_max_batch_size} posts",
+            status_code=413,
+            mimetype="application/json"
+        )
+
+    # Each post gets an equal share of the batch output allowance for its model response
+    classifier = PostClassifier(
+        env_model_url,
+        env_model_key,
+        max_response_bytes=min(env_max_response_bytes, env_max_batch_response_bytes // max(len(lines), 1))
+    )
+    output = io.BytesIO()
+    for line_number, line in lines:
+        try:
+            record = json.loads(line)
+            post_text = record.get('text') if isinstance(record, dict) else None
+            if not post_text:
+                raise ValueError("Please pass a 'text' property in each line")
+            result = classifier.classify_post(post_text)
+            output_line = {"line": line_number, "status_code": result["status_code"], "result": parse_model_body(result["body"])}
+        except ValueError as e:
+            output_line = {"line": line_number, "status_code": 400, "error": f"Invalid input: {str(e)}"}
+        except Exception as e:
+            output_line = {"line": line_number, "status_code": 500, "error": f"An error occurred: {str(e)}"}
+
+        encoded = json.dumps(output_line).encode('utf-8') + b"\n"
+        if output.tell() + len(encoded) > env_max_batch_response_bytes:
+            # Keep the results already paid for and tell the client where the batch was cut off
+            output.write(json.dumps({
+                "line": line_number,
+                "status_code": 413,
+                "error": f"Batch too large: response exceeds {env_max_batch_response_bytes} bytes, "
+                         f"posts from line {line_number} on were not returned"
+            }).encode('utf-8') + b"\n")
+            return func.HttpResponse(
+                body=output.getvalue(),
+                status_code=413,
+                mimetype="application/x-ndjson"
+            )
+        output.write(encoded)
+
+    return func.HttpResponse(
+        body=output.getvalue(),
+        status_code=200,
+        mimetype="application/x-ndjson"
+    )
+
+def request_too_large(req):
+    content_length = req.headers.get('Content-Length')
+    if content_length and content_length.isdigit() and int(content_length) > env_max_request_bytes:
+        return True
+    return len(req.get_body()) > env_max_request_bytes
+
 app = func.FunctionApp()
 
 @app.function_name(name="ClassifyPost")
 @app.route(route="classify_post", auth_level=func.AuthLevel.ANONYMOUS)
 def classify_post_function(req: func.HttpRequest) -> func.HttpResponse:
+    if request_too_large(req):
+        return func.HttpResponse(
+            body=f"Request body exceeds {env_max_request_bytes} bytes",
+            status_code=413,
+            mimetype="application/json"
+        )
+
+    content_type = req.headers.get('Content-Type', '').split(';')[0].strip().lower()
+    if content_type in NDJSON_MIMETYPES:
+        return classify_batch_function_wrapper(req.get_body())
+
     try:
         req_body = req.get_json()
     except ValueError as e:
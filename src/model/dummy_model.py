@@ -1,39 +1,167 @@
+import hashlib
+import threading
+import time
 import numpy as np
-from typing import Dict, List
+from typing import Dict, List, Optional, Sequence, Tuple
+
+DEFAULT_TOPICS: List[str] = ['soccer', 'fashion', 'food', 'technology', 'travel']
+MAX_TOPICS: int = 1000
 
 class DummyTopicClassifier:
-    def __init__(self) -> None:
-        self.topics: List[str] = ['soccer', 'fashion', 'food', 'technology', 'travel']
+    def __init__(
+        self,
+        num_topics: Optional[int] = None,
+        topics: Optional[Sequence[str]] = None,
+        seed: Optional[int] = None,
+        deterministic: bool = False,
+        latency_ms: float = 0.0,
+        latency_jitter_ms: float = 0.0,
+        compute_cost: int = 0,
+    ) -> None:
+        """
+        Create a dummy classifier that returns random topic probabilities.
+
+        Args:
+            num_topics (Optional[int]): Number of topics to generate. The default topics are used
+                first and padded with 'topic_<n>' names. Ignored if `topics` is given.
+            topics (Optional[Sequence[str]]): Explicit list of topic names.
+            seed (Optional[int]): Seed for the classifier's own random generator.
+            deterministic (bool): If True, the prediction for a text depends only on the text and
+                the seed, so repeated calls with the same input return the same probabilities.
+            latency_ms (float): Simulated mean latency per predict call, in milliseconds.
+            latency_jitter_ms (float): Standard deviation of the simulated latency, in milliseconds.
+            compute_cost (int): Number of simulated dense layer passes per predicted text.
+
+        Raises:
+            ValueError: If the topic configuration or the simulation parameters are invalid.
+        """
+        if topics is not None:
+            self.topics: List[str] = list(topics)
+        elif num_topics is not None:
+            if not 1 <= num_topics <= MAX_TOPICS:
+                raise ValueError(f"Number of topics must be between 1 and {MAX_TOPICS}")
+            self.topics = DEFAULT_TOPICS[:num_topics] + [
+                f"topic_{i}" for i in range(len(DEFAULT_TOPICS), num_topics)
+            ]
+        else:
+            self.topics = list(DEFAULT_TOPICS)
+
+        if not 1 <= len(self.topics) <= MAX_TOPICS:
+            raise ValueError(f"Number of topics must be between 1 and {MAX_TOPICS}")
+        if len(set(self.topics)) != len(self.topics):
+            raise ValueError("Topic names must be unique")
+        if latency_ms < 0 or latency_jitter_ms < 0 or compute_cost < 0:
+            raise ValueError("Latency and compute cost must be non-negative")
+
+        self.seed: Optional[int] = seed
+        self.deterministic: bool = deterministic
+        self.latency_ms: float = latency_ms
+        self.latency_jitter_ms: float = latency_jitter_ms
+        self.compute_cost: int = compute_cost
+
+        # numpy Generators are not thread-safe, so each thread draws from its own generators
+        # spawned from the classifier seed instead of contending on a shared one. The weights
+        # get a child of their own, spawned first, so the simulation settings never shift the
+        # seeded prediction stream.
+        self._seed_sequence: np.random.SeedSequence = np.random.SeedSequence(seed)
+        weights_seed: np.random.SeedSequence = self._seed_sequence.spawn(1)[0]
+        self._spawn_lock: threading.Lock = threading.Lock()
+        self._local: threading.local = threading.local()
+        self._alpha: np.ndarray = np.ones(len(self.topics))
+        self._weights: Optional[np.ndarray] = None
+        if compute_cost:
+            weights_rng: np.random.Generator = np.random.default_rng(weights_seed)
+            self._weights = weights_rng.standard_normal((len(self.topics), len(self.topics))) / len(self.topics)
 
     def predict(self, text: str) -> Dict[str, float]:
         """
         Predict topic probabilities for a given text.
-        
+
         Args:
             text (str): The input text to classify.
-        
+
         Returns:
             Dict[str, float]: A dictionary of topic probabilities.
-        
+
         Raises:
             TypeError: If the input is not a string.
         """
-        if not isinstance(text, str):
+        return self.predict_batch([text])[0]
+
+    def predict_batch(self, texts: Sequence[str]) -> List[Dict[str, float]]:
+        """
+        Predict topic probabilities for several texts at once.
+
+        Args:
+            texts (Sequence[str]): The input texts to classify.
+
+        Returns:
+            List[Dict[str, float]]: One dictionary of topic probabilities per input text.
+
+        Raises:
+            TypeError: If any input is not a string.
+        """
+        if isinstance(texts, str) or not all(isinstance(text, str) for text in texts):
             raise TypeError("Input must be a string")
-        
+        if not texts:
+            return []
+
         # Generate random probabilities
-        probabilities: np.ndarray = np.random.dirichlet(np.ones(len(self.topics)), size=1)[0]
-        return dict(zip(self.topics, probabilities))
+        if self.deterministic:
+            probabilities: np.ndarray = np.stack([
+                self._text_rng(text).dirichlet(self._alpha) for text in texts
+            ])
+        else:
+            probabilities = self._thread_rng().dirichlet(self._alpha, size=len(texts))
+
+        self._simulate_cost(len(texts))
+        return [dict(zip(self.topics, row)) for row in probabilities.tolist()]
 
     def get_topics(self) -> List[str]:
         """
         Get the list of topics.
-        
+
         Returns:
             List[str]: The list of topics.
         """
         return self.topics
 
+    def _thread_rng(self) -> np.random.Generator:
+        """Get the calling thread's prediction generator."""
+        return self._thread_rngs()[0]
+
+    def _latency_rng(self) -> np.random.Generator:
+        """Get the calling thread's latency generator."""
+        return self._thread_rngs()[1]
+
+    def _thread_rngs(self) -> Tuple[np.random.Generator, np.random.Generator]:
+        """Get the calling thread's generators, spawning them from the classifier seed on first use."""
+        rngs: Optional[Tuple[np.random.Generator, np.random.Generator]] = getattr(self._local, 'rngs', None)
+        if rngs is None:
+            # SeedSequence.spawn is stateful, so only spawning is serialized
+            with self._spawn_lock:
+                prediction_seed, latency_seed = self._seed_sequence.spawn(2)
+            rngs = self._local.rngs = (np.random.default_rng(prediction_seed), np.random.default_rng(latency_seed))
+        return rngs
+
+    def _text_rng(self, text: str) -> np.random.Generator:
+        """Create a generator seeded from the text and the classifier seed."""
+        digest: bytes = hashlib.blake2b(text.encode('utf-8'), digest_size=8).digest()
+        # SeedSequence pads entropy with zeros, so the seed is shifted to keep seed=0 distinct from no seed
+        entropy: List[int] = [int.from_bytes(digest, 'little'), 0 if self.seed is None else self.seed + 1]
+        return np.random.default_rng(entropy)
+
+    def _simulate_cost(self, batch_size: int) -> None:
+        """Burn CPU and sleep according to the configured compute cost and latency profile."""
+        if self._weights is not None:
+            activations: np.ndarray = np.ones((batch_size, len(self.topics)))
+            for _ in range(self.compute_cost):
+                activations = np.tanh(activations @ self._weights)
+
+        if self.latency_ms or self.latency_jitter_ms:
+            delay_ms: float = self._latency_rng().normal(self.latency_ms, self.latency_jitter_ms)
+            time.sleep(max(delay_ms, 0.0) / 1000)
+
 # for local testing
 if __name__ == "__main__":
     classifier: DummyTopicClassifier = DummyTopicClassifier()
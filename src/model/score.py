@@ -1,5 +1,5 @@
 import json
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 import os, sys
 from pathlib import Path
 
@@ -14,8 +14,23 @@ class Scorer:
         self.model: DummyTopicClassifier = None
 
     def init(self) -> None:
-        """Initialize the model."""
-        self.model = DummyTopicClassifier()
+        """
+        Initialize the model.
+
+        The dummy model can be tuned for load testing through the DUMMY_MODEL_NUM_TOPICS,
+        DUMMY_MODEL_SEED, DUMMY_MODEL_DETERMINISTIC, DUMMY_MODEL_LATENCY_MS,
+        DUMMY_MODEL_LATENCY_JITTER_MS and DUMMY_MODEL_COMPUTE_COST environment variables.
+        """
+        num_topics: Optional[str] = os.getenv('DUMMY_MODEL_NUM_TOPICS')
+        seed: Optional[str] = os.getenv('DUMMY_MODEL_SEED')
+        self.model = DummyTopicClassifier(
+            num_topics=int(num_topics) if num_topics else None,
+            seed=int(seed) if seed else None,
+            deterministic=os.getenv('DUMMY_MODEL_DETERMINISTIC', '').lower() in ('1', 'true', 'yes'),
+            latency_ms=float(os.getenv('DUMMY_MODEL_LATENCY_MS', '0')),
+            latency_jitter_ms=float(os.getenv('DUMMY_MODEL_LATENCY_JITTER_MS', '0')),
+            compute_cost=int(os.getenv('DUMMY_MODEL_COMPUTE_COST', '0'))
+        )
 
     def run(self, raw_data: str) -> str:
         """
@@ -2,6 +2,9 @@ import pytest
 import os
 import sys
 import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from src.model.dummy_model import DummyTopicClassifier
 
 def test_dummy_classifier_initialization():
@@ -89,6 +92,132 @@ def test_probability_sum():
         result = classifier.predict(text)
         assert pytest.approx(sum(result.values()), 1e-6) == 1.0
 
+def test_seeded_classifiers_are_reproducible():
+    """Test that two classifiers with the same seed produce the same sequence of predictions."""
+    classifier1 = DummyTopicClassifier(seed=42)
+    classifier2 = DummyTopicClassifier(seed=42)
+    for text in ["First post", "Second post", "First post"]:
+        assert classifier1.predict(text) == classifier2.predict(text)
+
+def test_deterministic_mode_depends_only_on_text():
+    """Test that deterministic mode returns the same probabilities for the same text."""
+    classifier = DummyTopicClassifier(seed=7, deterministic=True)
+    result1 = classifier.predict("Same post")
+    classifier.predict("Some other post")
+    result2 = classifier.predict("Same post")
+
+    assert result1 == result2
+    assert result1 != classifier.predict("Different post")
+    assert result1 == DummyTopicClassifier(seed=7, deterministic=True).predict("Same post")
+    assert result1 != DummyTopicClassifier(seed=8, deterministic=True).predict("Same post")
+
+def test_deterministic_seed_zero_differs_from_unseeded():
+    """Test that seed=0 is a distinct seed in deterministic mode rather than a no-op."""
+    seeded = DummyTopicClassifier(seed=0, deterministic=True)
+    unseeded = DummyTopicClassifier(deterministic=True)
+    assert seeded.predict("Same post") != unseeded.predict("Same post")
+
+@pytest.mark.parametrize("deterministic", [False, True])
+def test_simulation_settings_do_not_change_seeded_predictions(deterministic):
+    """Test that compute cost and latency settings leave the seeded predictions unchanged."""
+    texts = ["First post", "Second post", "First post"]
+    plain = DummyTopicClassifier(seed=5, deterministic=deterministic)
+    simulated = DummyTopicClassifier(seed=5, deterministic=deterministic, compute_cost=3, latency_ms=1, latency_jitter_ms=1)
+    assert [plain.predict(text) for text in texts] == [simulated.predict(text) for text in texts]
+
+def test_configurable_topic_count():
+    """Test that the classifier can be configured with hundreds of topics."""
+    classifier = DummyTopicClassifier(num_topics=300)
+    topics = classifier.get_topics()
+    result = classifier.predict("Test post")
+
+    assert len(topics) == 300
+    assert len(set(topics)) == 300
+    assert topics[:5] == ['soccer', 'fashion', 'food', 'technology', 'travel']
+    assert set(result.keys()) == set(topics)
+    assert pytest.approx(sum(result.values()), 1e-6) == 1.0
+
+def test_custom_topics():
+    """Test that an explicit list of topics is used as given."""
+    classifier = DummyTopicClassifier(topics=['cats', 'dogs'])
+    assert classifier.get_topics() == ['cats', 'dogs']
+    assert set(classifier.predict("Test post").keys()) == {'cats', 'dogs'}
+
+@pytest.mark.parametrize("kwargs", [
+    {"num_topics": 0},
+    {"num_topics": -2},
+    {"num_topics": 1001},
+    {"topics": ['cats', 'cats']},
+    {"latency_ms": -1},
+    {"compute_cost": -1}
+])
+def test_invalid_configuration(kwargs):
+    """Test that invalid configurations raise ValueError."""
+    with pytest.raises(ValueError):
+        DummyTopicClassifier(**kwargs)
+
+def test_predict_batch():
+    """Test that predict_batch returns one valid distribution per input text."""
+    classifier = DummyTopicClassifier(num_topics=50, seed=1)
+    texts = ["one", "two", "three"]
+    results = classifier.predict_batch(texts)
+
+    assert len(results) == len(texts)
+    for result in results:
+        assert set(result.keys()) == set(classifier.get_topics())
+        assert pytest.approx(sum(result.values()), 1e-6) == 1.0
+    assert classifier.predict_batch([]) == []
+    with pytest.raises(TypeError):
+        classifier.predict_batch(["one", 2])
+    with pytest.raises(TypeError):
+        classifier.predict_batch("one")
+
+def test_deterministic_batch_matches_single_predictions():
+    """Test that deterministic batch predictions match single predictions."""
+    classifier = DummyTopicClassifier(seed=3, deterministic=True)
+    texts = ["one", "two", "three"]
+    assert classifier.predict_batch(texts) == [classifier.predict(text) for text in texts]
+
+def test_threads_use_separate_generators():
+    """Test that concurrent random predictions each draw from a per-thread generator."""
+    classifier = DummyTopicClassifier(num_topics=200, seed=13)
+    barrier = threading.Barrier(4)
+
+    def predict_in_thread(text):
+        barrier.wait()
+        return classifier.predict(text), classifier._thread_rng()
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        outputs = list(executor.map(predict_in_thread, [f"post {i}" for i in range(4)]))
+
+    assert all(pytest.approx(sum(result.values()), 1e-6) == 1.0 for result, _ in outputs)
+    assert len({id(rng) for _, rng in outputs}) == 4
+
+def test_simulated_latency():
+    """Test that the latency profile delays predictions."""
+    classifier = DummyTopicClassifier(latency_ms=20)
+    start = time.perf_counter()
+    classifier.predict("Test post")
+    assert time.perf_counter() - start >= 0.02
+
+def test_simulated_compute_cost():
+    """Test that a compute cost still produces valid predictions."""
+    classifier = DummyTopicClassifier(num_topics=100, compute_cost=5, seed=0)
+    result = classifier.predict("Test post")
+    assert len(result) == 100
+    assert pytest.approx(sum(result.values()), 1e-6) == 1.0
+
+def test_concurrent_deterministic_predictions():
+    """Test that deterministic predictions are unaffected by concurrent callers."""
+    classifier = DummyTopicClassifier(num_topics=200, seed=11, deterministic=True)
+    texts = [f"post {i}" for i in range(50)]
+    expected = [classifier.predict(text) for text in texts]
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(classifier.predict, texts))
+
+    assert results == expected
+
 def test_dummy_model_script_execution():
     """
     Test the execution of dummy_model.py as a script.
@@ -3,14 +3,22 @@ import pytest
 from unittest.mock import patch, MagicMock
 import azure.functions as func
 import urllib.error
-from src.api.function_app import classify_post_function_wrapper, PostClassifier
+from src.api.function_app import (
+    get_int_setting,
+    classify_post_function,
+    classify_post_function_wrapper,
+    classify_batch_function_wrapper,
+    PostClassifier
+)
 
 @pytest.fixture
 def mock_env_variables():
+    # function_app reads the environment at import, so patch its module-level copies too
     with patch.dict('os.environ', {
         'MODEL_ENDPOINT_URL': 'http://test-url.com',
         'MODEL_KEY': 'test-key'
-    }):
+    }), patch('src.api.function_app.env_model_url', 'http://test-url.com'), \
+            patch('src.api.function_app.env_model_key', 'test-key'):
         yield
 
 class TestClassifyPostFunction:
@@ -96,5 +104,174 @@ class TestClassifyPostFunction:
         assert response.status_code == 500
         assert "An error occurred: HTTP error occurred: 404 Not Found" in response.get_body().decode()
 
+    @patch('src.api.function_app.env_max_request_bytes', 10)
+    def test_classify_post_function_body_too_large(self, mock_env_variables):
+        req = func.HttpRequest('POST', '/api/classify_post', body=json.dumps({"text": "A post that is too long"}).encode())
+
+        response = classify_post_function(req)
+
+        assert response.status_code == 413
+        assert "Request body exceeds 10 bytes" in response.get_body().decode()
+
+    @patch('src.api.function_app.env_max_request_bytes', 10)
+    def test_classify_post_function_content_length_too_large(self, mock_env_variables):
+        req = func.HttpRequest('POST', '/api/classify_post', body=b'{}', headers={'Content-Length': '1000'})
+
+        response = classify_post_function(req)
+
+        assert response.status_code == 413
+
+    def test_classify_post_function_json(self, mock_env_variables):
+        req = func.HttpRequest('POST', '/api/classify_post', body=json.dumps({"text": "Test post"}).encode())
+
+        with patch.object(PostClassifier, 'classify_post', return_value={"body": json.dumps({"result": {"topic1": 1.0}}), "status_code": 200}):
+            response = classify_post_function(req)
+
+        assert response.status_code == 200
+        assert json.loads(response.get_body()) == {"result": {"topic1": 1.0}}
+
+    def test_classify_post_function_ndjson_batch(self, mock_env_variables):
+        body = b'{"text": "First post"}\n\n{"text": ""}\nnot json\n{"text": "Last post"}\n'
+        req = func.HttpRequest('POST', '/api/classify_post', body=body, headers={'Content-Type': 'application/x-ndjson; charset=utf-8'})
+
+        with patch.object(PostClassifier, 'classify_post', return_value={"body": json.dumps({"result": {"topic1": 1.0}}), "status_code": 200}) as mock_classify:
+            response = classify_post_function(req)
+
+        assert response.status_code == 200
+        assert response.mimetype == "application/x-ndjson"
+        lines = [json.loads(line) for line in response.get_body().decode().splitlines()]
+        assert [line["line"] for line in lines] == [1, 3, 4, 5]
+        assert [line["status_code"] for line in lines] == [200, 400, 400, 200]
+        assert lines[0]["result"] == {"result": {"topic1": 1.0}}
+        assert "Invalid input" in lines[2]["error"]
+        assert mock_classify.call_count == 2
+
+    def test_classify_batch_function_wrapper_upstream_error(self, mock_env_variables):
+        with patch.object(PostClassifier, 'classify_post', side_effect=Exception("Test exception")):
+            response = classify_batch_function_wrapper(b'{"text": "Test post"}\n')
+
+        line = json.loads(response.get_body())
+        assert line["status_code"] == 500
+        assert "An error occurred: Test exception" in line["error"]
+
+    def test_classify_batch_function_wrapper_invalid_model_body(self, mock_env_variables):
+        with patch.object(PostClassifier, 'classify_post', return_value={"body": "not json", "status_code": 200}):
+            response = classify_batch_function_wrapper(b'{"text": "Test post"}\n')
+
+        line = json.loads(response.get_body())
+        assert line["status_code"] == 500
+        assert "Invalid model response" in line["error"]
+
+    @patch('src.api.function_app.env_max_batch_response_bytes', 200)
+    def test_classify_batch_function_wrapper_response_too_large(self, mock_env_variables):
+        body = b'{"text": "Test post"}\n' * 10
+        model_body = json.dumps({"result": {"topic1": 1.0, "padding": "x" * 50}})
+
+        with patch.object(PostClassifier, 'classify_post', return_value={"body": model_body, "status_code": 200}) as mock_classify:
+            response = classify_batch_function_wrapper(body)
+
+        assert response.status_code == 413
+        assert response.mimetype == "application/x-ndjson"
+        lines = [json.loads(line) for line in response.get_body().decode().splitlines()]
+        assert len(response.get_body()) <= 200 + len(response.get_body().splitlines()[-1]) + 1
+        assert all(line["status_code"] == 200 for line in lines[:-1])
+        assert len(lines) > 1
+        assert lines[-1]["status_code"] == 413
+        assert "Batch too large: response exceeds 200 bytes" in lines[-1]["error"]
+        assert mock_classify.call_count == len(lines)
+
+    @patch('src.api.function_app.env_max_batch_response_bytes', 1000)
+    @patch('urllib.request.urlopen')
+    def test_classify_batch_function_wrapper_splits_response_allowance(self, mock_urlopen, mock_env_variables):
+        mock_response = MagicMock()
+        mock_response.headers = {}
+        mock_response.getcode.return_value = 200
+        mock_response.read.return_value = b'{"result": "' + b'x' * 300 + b'"}'
+        mock_urlopen.return_value.__enter__.return_value = mock_response
+
+        response = classify_batch_function_wrapper(b'{"text": "Test post"}\n' * 4)
+
+        assert response.status_code == 200
+        lines = [json.loads(line) for line in response.get_body().decode().splitlines()]
+        assert len(lines) == 4
+        assert all("Model response exceeds 250 bytes" in line["error"] for line in lines)
+
+    @patch('src.api.function_app.env_max_batch_size', 2)
+    def test_classify_batch_function_wrapper_batch_too_large(self, mock_env_variables):
+        body = b'{"text": "1"}\n{"text": "2"}\n{"text": "3"}\n'
+
+        with patch.object(PostClassifier, 'classify_post') as mock_classify:
+            response = classify_batch_function_wrapper(body)
+
+        assert response.status_code == 413
+        assert "Batch too large" in response.get_body().decode()
+        mock_classify.assert_not_called()
+
+    @patch('urllib.request.urlopen')
+    def test_classify_post_reads_response_in_chunks(self, mock_urlopen):
+        mock_response = MagicMock()
+        mock_response.headers = {}
+        mock_response.getcode.return_value = 200
+        mock_response.read.side_effect = [b'{"result":', b' {}}', b'']
+        mock_urlopen.return_value.__enter__.return_value = mock_response
+
+        result = PostClassifier('http://test-url.com', 'test-key').classify_post("Test post")
+
+        assert result == {"body": '{"result": {}}', "status_code": 200}
+
+    @patch('urllib.request.urlopen')
+    def test_classify_post_response_too_large(self, mock_urlopen):
+        mock_response = MagicMock()
+        mock_response.headers = {}
+        mock_response.read.side_effect = [b'a' * 8, b'a' * 8, b'']
+        mock_urlopen.return_value.__enter__.return_value = mock_response
+
+        with pytest.raises(Exception, match="Model response exceeds 10 bytes"):
+            PostClassifier('http://test-url.com', 'test-key', max_response_bytes=10).classify_post("Test post")
+        assert mock_response.read.call_count == 2
+
+    @patch('urllib.request.urlopen')
+    def test_classify_post_response_invalid_content_length(self, mock_urlopen):
+        mock_response = MagicMock()
+        mock_response.headers = {'Content-Length': 'abc'}
+        mock_urlopen.return_value.__enter__.return_value = mock_response
+
+        with pytest.raises(Exception, match="invalid Content-Length") as exc_info:
+            PostClassifier('http://test-url.com', 'test-key').classify_post("Test post")
+        assert not isinstance(exc_info.value, ValueError)
+
+    @patch('urllib.request.urlopen')
+    def test_classify_post_explicit_zero_response_limit(self, mock_urlopen):
+        mock_response = MagicMock()
+        mock_response.headers = {}
+        mock_response.read.side_effect = [b'{}', b'']
+        mock_urlopen.return_value.__enter__.return_value = mock_response
+
+        with pytest.raises(Exception, match="Model response exceeds 0 bytes"):
+            PostClassifier('http://test-url.com', 'test-key', max_response_bytes=0).classify_post("Test post")
+
+    @patch('urllib.request.urlopen')
+    def test_classify_post_response_content_length_too_large(self, mock_urlopen):
+        mock_response = MagicMock()
+        mock_response.headers = {'Content-Length': '1000'}
+        mock_urlopen.return_value.__enter__.return_value = mock_response
+
+        with pytest.raises(Exception, match="Model response exceeds 10 bytes"):
+            PostClassifier('http://test-url.com', 'test-key', max_response_bytes=10).classify_post("Test post")
+        mock_response.read.assert_not_called()
+
+@pytest.mark.parametrize("value, expected", [
+    (None, 100),
+    ("", 100),
+    ("25", 25),
+    ("0", 0),
+    ("not a number", 100),
+    ("-5", 100)
+])
+def test_get_int_setting(value, expected):
+    env = {} if value is None else {'TEST_INT_SETTING': value}
+    with patch.dict('os.environ', env, clear=True):
+        assert get_int_setting('TEST_INT_SETTING', 100) == expected
+
 if __name__ == "__main__":
     pytest.main()
@@ -144,3 +144,21 @@ def test_scorer_run_with_environment(scorer):
         input_data = json.dumps({"text": "Test post"})
         result = scorer.run(input_data)
         assert 'result' in json.loads(result), "Scorer's run method did not return a result. Check if the method is correctly processing the input and using the model."
+
+def test_scorer_model_configuration_from_environment():
+    """
+    Test if the Scorer configures the dummy model from environment variables.
+    """
+    with patch.dict('os.environ', {
+        'DUMMY_MODEL_NUM_TOPICS': '100',
+        'DUMMY_MODEL_SEED': '5',
+        'DUMMY_MODEL_DETERMINISTIC': 'true'
+    }):
+        scorer = Scorer()
+        scorer.init()
+
+    assert len(scorer.model.get_topics()) == 100
+    assert scorer.model.deterministic
+    input_data = json.dumps({"text": "Test post"})
+    assert scorer.run(input_data) == scorer.run(input_data)
+    assert len(json.loads(scorer.run(input_data))["result"]) == 100